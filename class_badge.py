@@ -1,6 +1,8 @@
 import json
 
 class Badge:
+    __slots__ = ('name', 'description', 'metric', 'threshold')
+    
     def __init__(self, name, description, metric, threshold):
         self.name = name 
         self.description = description  
@@ -14,7 +16,12 @@ class Badge:
         :return: A dictionary representation of the Badge instance.
         """
         
-        return vars(self)
+        return {
+            "name": self.name,
+            "description": self.description,
+            "metric": self.metric,
+            "threshold": self.threshold
+        }
 
     def check_completion(self, user_progress):
         """
@@ -34,15 +41,13 @@ def load_badges_from_json(json_file):
     with open(json_file, 'r') as file:
         badge_data = json.load(file)
     
-    badges = []
-    for category, category_badges in badge_data.items():
-        for badge_info in category_badges:
-            badge = Badge(
-                name=badge_info['name'],
-                description=badge_info['description'],
-                metric=category,
-                threshold=badge_info['threshold']
-            )
-            badges.append(badge)
-    
-    return badges
\ No newline at end of file
+    return [
+        Badge(
+            name=badge_info['name'],
+            description=badge_info['description'],
+            metric=category,
+            threshold=badge_info['threshold']
+        )
+        for category, category_badges in badge_data.items()
+        for badge_info in category_badges
+    ]
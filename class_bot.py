@@ -13,11 +13,13 @@ Attributes:
 Methods:
     __new__: Singleton pattern "constructor" to create Bot instance if none exists and return it.
     run: Runs the Bot instance using the token.
+    start: Connects the Bot instance and closes its HTTP session on shutdown.
 
 Events:
+    setup_hook: Called once after login, before the bot connects to the gateway.
     on_ready: Called when the client is done preparing the data received from Discord.
     on_member_join: Called when a Member joins a Guild.
-    on_reaction_add: Called when a Member joins a Guild.
+    on_raw_reaction_add: Called when a reaction is added to any message, cached or not.
     
 Tasks:
     check_review: This task runs every 30 minutes to check if users have flashcards ready for review. It sends reminders to users via direct message for the flashcards that need review.
@@ -32,23 +34,78 @@ import os
 import logging
 import discord
 import asyncio
-import datetime
+import aiohttp
+import time
 import re
 import json
+from collections import OrderedDict
 from discord.ext import commands, tasks
 import korean_dictionary
 import class_badge
 from dotenv import load_dotenv
 from class_interaction_objects import FlashcardObject, FlashcardFilter
 
+# reaction that saves a search result as a flashcard
+ADD_FLASHCARD_REACTION = '📝'
+
+# number of recent search result messages kept so reactions to them skip a message fetch
+SEARCH_RESULT_CACHE_SIZE = 256
+
+# label and delete reactions shown on a flashcard set
+FLASHCARD_SET_REACTIONS = frozenset(('🏷️', '🗑️'))
+
+# cancel reaction shown on label and delete prompts
+CANCEL_REACTIONS = frozenset(('❌',))
+
+# flip and end buttons shown on the front of a quiz flashcard
+FRONT_BUTTONS = ('🔄', '❌')
+
+# rating buttons shown on the back of a quiz flashcard, mapped to FlashcardObject rating codes
+RATING_BUTTONS = {
+    '🟥': FlashcardObject.POOR,
+    '🟨': FlashcardObject.OKAY,
+    '🟩': FlashcardObject.GOOD
+}
+
+# label input: a label followed by flashcard numbers and ranges, e.g. "animals 4, 15, 6-13"
+LABEL_INPUT_PATTERN = re.compile(r'^([^\d]+)(\d+(-\d+)?(,\s*\d+(-\d+)?)*?)$')
+
+# delete input: flashcard numbers and ranges separated by commas, e.g. "4, 15, 6-13"
+NUMBER_LIST_PATTERN = re.compile(r'\s*\d+\s*(-\s*\d+\s*)?(,\s*\d+\s*(-\s*\d+\s*)?)*')
+
+# a single flashcard number or range within a number list
+NUMBER_RANGE_PATTERN = re.compile(r'(\d+)\s*(?:-\s*(\d+))?')
+
+# constant parts of the search result embed; the rest is filled in per result
+SEARCH_RESULT_TEMPLATE = {
+    "type": "rich",
+    "color": 0x5865f2
+}
+
+# constant parts of the quiz flashcard embeds; fields and footer are filled in per card
+FLASHCARD_FRONT_TEMPLATE = {
+    "type": "rich",
+    "title": 'Flashcard - Front',
+    "color": 0xcccccc
+}
+FLASHCARD_BACK_TEMPLATE = {
+    "type": "rich",
+    "title": 'Flashcard - Back',
+    "color": 0xcccccc
+}
+
 class CustomHelpCommand(commands.DefaultHelpCommand):
     """
     Override behavior of Discord.py default help command
     """
     
+    # the command set doesn't change after startup, so the bot help embed is built once
+    _cached_embed = None
+    
     async def send_bot_help(self, mapping):
-        embed = self.get_bot_help_embed(mapping)
-        await self.get_destination().send(embed=embed)
+        if CustomHelpCommand._cached_embed is None:
+            CustomHelpCommand._cached_embed = self.get_bot_help_embed(mapping)
+        await self.get_destination().send(embed=CustomHelpCommand._cached_embed)
 
     def get_bot_help_embed(self, mapping):
         embed = discord.Embed(title="Help", color=0x5865f2)
@@ -58,19 +115,69 @@ class CustomHelpCommand(commands.DefaultHelpCommand):
         embed.set_footer(text="Type !help command for more info on a command.")
         return embed
 
+class QuizButtons(discord.ui.View):
+    """
+    A row of emoji buttons under a quiz flashcard that records which one the quiz taker pressed.
+    """
+    
+    def __init__(self, user_id, emojis, responses=None):
+        """
+        :param user_id: The ID of the only user whose presses are accepted.
+        :param emojis: The emojis to show as buttons, in display order.
+        :param responses: Optional. The message edits to make when a button is pressed, by emoji;
+            other presses just remove the buttons.
+        """
+        
+        super().__init__(timeout=60)
+        self.user_id = user_id
+        # the pressed emoji, and the same emoji once the press's message edit has gone through
+        self.pressed = None
+        self.value = None
+        self.responses = responses or {}
+        
+        for emoji in emojis:
+            button = discord.ui.Button(emoji=emoji, style=discord.ButtonStyle.secondary)
+            button.callback = self.make_callback(emoji)
+            self.add_item(button)
+    
+    def make_callback(self, emoji):
+        async def callback(interaction):
+            self.pressed = emoji
+            try:
+                # the press is acknowledged by the press's own edit, so the message is only edited once;
+                # removing the buttons otherwise keeps stale ones from being pressed again
+                await interaction.response.edit_message(**self.responses.get(emoji, {"view": None}))
+            except discord.HTTPException as err:
+                # value stays unset, so the quiz knows to make the edit itself
+                logging.warning(f"Couldn't respond to quiz button press: {err}")
+            else:
+                self.value = emoji
+            finally:
+                # wake the quiz only once the edit is done, so its next edit can't race this one
+                self.stop()
+        
+        return callback
+    
+    async def interaction_check(self, interaction):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("This isn't your quiz.", ephemeral=True)
+            return False
+        return True
+
 class Bot:
     """Encapsulates a discord.ext commands Bot."""
 
     _instance = None
-    _bot = commands.Bot(
-        command_prefix='!', 
-        intents=discord.Intents(messages=True, guilds=True, members=True, message_content=True, reactions=True),
-        help_command=CustomHelpCommand(show_parameter_descriptions=False)
-    )
+    # created by the first Bot() call rather than on import
+    _bot = None
     _guild = None
     _table = None
     _help_data = None
     _badge_data = None
+    # HTTP session shared by every dictionary search, created in setup_hook
+    _http_session = None
+    # SearchObjects of the most recent search result messages, by message ID
+    _search_results = OrderedDict()
 
     def __new__(cls, table):
         """
@@ -82,10 +189,21 @@ class Bot:
         load_dotenv()
         
         if cls._instance is None:
-            print('Creating a Bot instance...')
+            logging.info('Creating a Bot instance...')
             cls._instance = super(Bot, cls).__new__(cls)
             cls._guild = None
             cls._table = table
+            cls._bot = commands.Bot(
+                command_prefix='!', 
+                intents=discord.Intents(messages=True, guilds=True, members=True, message_content=True, reactions=True),
+                help_command=CustomHelpCommand(show_parameter_descriptions=False)
+            )
+            
+            # register the module's event handlers and commands on the new bot
+            for event in (setup_hook, on_ready, on_member_join, on_raw_reaction_add):
+                cls._bot.event(event)
+            for command in (search, flashcards, quiz, stats):
+                cls._bot.add_command(command)
 
         return cls._instance
     
@@ -94,10 +212,39 @@ class Bot:
         Runs _bot class attribute using token.
         """
         
-        print("Running the Bot instance bot...")
-        cls._bot.run(os.getenv('DISCORD_TOKEN'))
+        logging.info("Running the Bot instance bot...")
+        
+        # set up only the discord logger, since main.py configures the root logger, and exit quietly on Ctrl-C, as discord.py's Client.run does
+        discord.utils.setup_logging(root=False)
+        try:
+            asyncio.run(cls.start())
+        except KeyboardInterrupt:
+            return
+    
+    async def start(cls):
+        """
+        Logs in and connects _bot class attribute, closing the shared HTTP session once it disconnects.
+        """
+        
+        try:
+            async with cls._bot:
+                await cls._bot.start(os.getenv('DISCORD_TOKEN'))
+        finally:
+            if cls._http_session is not None:
+                await cls._http_session.close()
     
 
+def pluralize(word, count):
+    """
+    Pluralize a word for display alongside a count.
+
+    :param word: The singular form of the word.
+    :param count: The number of items the word describes.
+    :return: The word unchanged if count is 1, otherwise the word with an "s" appended.
+    """
+    
+    return word if count == 1 else f"{word}s"
+
 def parse_label_input(input_string, max_num_flashcards):
     """
     Parse a string containing flashcard numbers and a label in various formats.
@@ -115,29 +262,15 @@ def parse_label_input(input_string, max_num_flashcards):
     
     """
     
-    match = re.match(r'^([^\d]+)(\d+(-\d+)?(,\s*\d+(-\d+)?)*?)$', input_string)
+    match = LABEL_INPUT_PATTERN.match(input_string)
     if not match:
         return None, []
 
-    label = match.group(1).strip()
-    flashcard_numbers = []
-    numbers_str = match.group(2)
-    flashcard_numbers = []
-    for part in numbers_str.split(','):
-        if '-' in part:
-            start, end = map(int, part.split('-'))
-            if not (1 <= start <= max_num_flashcards and 1 <= end <= max_num_flashcards):
-                return None, []
-            
-            flashcard_numbers.extend(range(start, end + 1))
-        else:
-            num = int(part)
-            if not 1 <= num <= max_num_flashcards:
-                return None, []
-            
-            flashcard_numbers.append(num)
+    flashcard_numbers = parse_number_list(match.group(2), max_num_flashcards)
+    if flashcard_numbers is None:
+        return None, []
             
-    return label, flashcard_numbers
+    return match.group(1).strip(), flashcard_numbers
 
 def parse_delete_input(input_string, max_num_flashcards):
     """
@@ -156,28 +289,68 @@ def parse_delete_input(input_string, max_num_flashcards):
     
     """
     
+    # reject anything that is not a comma-separated list of numbers and ranges before converting
+    if not NUMBER_LIST_PATTERN.fullmatch(input_string):
+        return []
+    
+    return parse_number_list(input_string, max_num_flashcards) or []
+
+def parse_number_list(numbers_str, max_num_flashcards):
+    """
+    Expand an already validated list of flashcard numbers and ranges, e.g. "4, 15, 6-13".
+
+    :param numbers_str: The string containing the flashcard numbers and ranges.
+    :param max_num_flashcards: The highest valid flashcard number.
+    :return: A list of integers representing the flashcard numbers, or None if any number is out of bounds.
+    """
+    
     flashcard_numbers = []
-    for part in input_string.split(','):
-        if '-' in part:
-            start, end = map(int, part.split('-'))
-            if not (1 <= start <= max_num_flashcards and 1 <= end <= max_num_flashcards):
-                return None, []
-            
-            flashcard_numbers.extend(range(start, end + 1))
-        else:
-            num = int(part)
-            if not 1 <= num <= max_num_flashcards:
-                return None, []
+    for number_match in NUMBER_RANGE_PATTERN.finditer(numbers_str):
+        start = int(number_match[1])
+        end = int(number_match[2]) if number_match[2] else start
+        if not (1 <= start <= max_num_flashcards and 1 <= end <= max_num_flashcards):
+            return None
             
-            flashcard_numbers.append(num)
+        flashcard_numbers.extend(range(start, end + 1))
             
     return flashcard_numbers
 
 
+def make_reaction_check(user_id, message_id, emojis):
+    """
+    Build a wait_for check that accepts reactions from one user on one message.
+
+    :param user_id: The ID of the user whose reactions are accepted.
+    :param message_id: The ID of the message the reactions must be on.
+    :param emojis: A set or mapping of the accepted emojis.
+    :return: A check function taking a reaction and a user.
+    """
+    
+    def check(reaction, user):
+        # the user ID is compared first since it rejects nearly every other event
+        return user.id == user_id and reaction.message.id == message_id and str(reaction.emoji) in emojis
+    
+    return check
+
+async def add_reactions(message, emojis):
+    """
+    Add reactions to a message in order.
+
+    Meant to run as a task alongside the wait_for that reads them, so the wait is listening
+    before the first reaction appears and doesn't sit behind every add_reaction round trip.
+    Discord shows reactions in the order they were added, so they aren't sent concurrently.
+
+    :param message: The message to react to.
+    :param emojis: The emojis to add, in display order.
+    """
+    
+    for emoji in emojis:
+        await message.add_reaction(emoji)
+
 async def wait_for_cancel_reaction(ctx, label_prompt):
     return await Bot._bot.wait_for(
         'reaction_add', 
-        check=lambda reaction, user: user == ctx.author and reaction.message.id == label_prompt.id and str(reaction.emoji) == '❌'
+        check=make_reaction_check(ctx.author.id, label_prompt.id, CANCEL_REACTIONS)
     )
 
 async def wait_for_message(ctx, user):
@@ -187,17 +360,120 @@ async def wait_for_message(ctx, user):
     )
 
 async def wait_for_cancel_reaction_or_message(ctx, user, label_prompt):
-    done, _ = await asyncio.wait(
+    """
+    Wait up to 60 seconds for either a cancel reaction on a prompt or a message from the user.
+
+    :return: The (reaction, user) tuple or the message, whichever arrived first, or None on timeout.
+    """
+    
+    done, pending = await asyncio.wait(
         [asyncio.create_task(wait_for_cancel_reaction(ctx, label_prompt)), asyncio.create_task(wait_for_message(ctx, user))],
         return_when=asyncio.FIRST_COMPLETED,
         timeout=60
     )
-    return done
+    
+    # stop the wait that lost so its listener does not linger on the bot
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    
+    return done.pop().result() if done else None
+
+
+def collect_reminder_packets(due_flashcards, current_time):
+    """
+    Collect the flashcards to send in each user's reminder, marking them as reminded.
+
+    Blocks on table reads, so it is meant to be run in a worker thread.
+
+    :param due_flashcards: A list of (Discord user, set of due flashcard IDs) tuples.
+    :param current_time: The current time in Unix seconds.
+    :return: A list of (Discord user, list of flashcard dicts) tuples with a non-empty packet per user.
+    """
+    
+    reminders = []
+    for user, flashcard_ids in due_flashcards:
+        user_entry = Bot._table.get_user(user, attributes=("preferences", "flashcard_set"))
+        if user_entry is None:
+            continue
+        
+        # leave the cards out of the queue, as build_review_queue does; studying them queues them again
+        if not user_entry["preferences"]["notifications"]:
+            continue
+        
+        reminder_packet = []
+        for flashcard_id in flashcard_ids:
+            flashcard_dict = user_entry["flashcard_set"].get(flashcard_id)
+            
+            # skip cards deleted or rescheduled since they were queued
+            if flashcard_dict is None:
+                continue
+            spaced_repetition = flashcard_dict["spaced_repetition"]
+            next_reminder = FlashcardObject.next_reminder_time(spaced_repetition)
+            if next_reminder is None or next_reminder > current_time:
+                continue
+            
+            spaced_repetition["to_review"] = True
+            spaced_repetition["last_reminded"] = current_time
+            reminder_packet.append(flashcard_dict)
+        
+        if reminder_packet:
+            reminders.append((user, reminder_packet))
+    
+    return reminders
+
+
+async def send_reminder(user, reminder_packet):
+    """
+    Send a user a DM listing flashcards to review, then save the flashcards as reminded.
+
+    :param user: The Discord user to remind.
+    :param reminder_packet: The list of flashcard dicts to review.
+    """
+    
+    num_flashcards = len(reminder_packet)
+    reminder_embed = discord.Embed.from_dict(
+        {
+            "type": "rich",
+            "title": "It's time to review these flashcards!",
+            "description": '\n'.join(
+                f'• {flashcard_dict["front"]["word"]} / {flashcard_dict["back"]["word"]}'
+                for flashcard_dict in reminder_packet
+            ),
+            "color": 0x5865f2,
+            "footer": {
+                "text": f'{num_flashcards} {pluralize("flashcard", num_flashcards)}'
+            }
+        }
+    )
+    # User.send reuses the DM channel discord.py caches on the user after the first reminder
+    await user.send(embed=reminder_embed)
+    
+    # update the flashcard data in the database
+    await asyncio.to_thread(Bot._table.update_flashcards, user, reminder_packet)
 
 
 # EVENTS
 
-@Bot._bot.event
+async def setup_hook():
+    """
+    Called once after login, before the bot connects to the gateway.
+    """
+    
+    # run new tasks eagerly so coroutines that finish without suspending skip the event loop queue (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
+    # one pooled session keeps dictionary API connections alive between searches
+    # searches give up after a few seconds rather than waiting out aiohttp's five minute default
+    Bot._http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=5)
+    )
+    
+    # load badge objects from json file before any command can be handled
+    Bot._badge_data = class_badge.load_badges_from_json("badges.json")
+
 async def on_ready():
     """
     Called when the client is done preparing the data received from Discord.
@@ -205,28 +481,21 @@ async def on_ready():
     
     Bot._guild = discord.utils.get(Bot._bot.guilds, name=os.getenv('DISCORD_GUILD'))
 
-    print(
-        f'\n{Bot._bot.user.name} is connected to the following guild:\n'
-        f'{Bot._guild.name} (id: {Bot._guild.id})\n'
-    )
+    logging.info("%s is connected to the following guild: %s (id: %s)", Bot._bot.user.name, Bot._guild.name, Bot._guild.id)
 
-    # get and print members in this guild
-    members = '\n - '.join([member.name for member in Bot._guild.members])
-    print(f'Guild Members:\n - {members}')
+    # list members in this guild when debugging; joining every name is wasted work otherwise
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        members = '\n - '.join(member.name for member in Bot._guild.members)
+        logging.debug(f'Guild Members:\n - {members}')
     
     # add any members to users table that are not already added
-    for member in Bot._guild.members:
-        if not member.bot:
-            Bot._table.add_user(member)
+    await asyncio.to_thread(Bot._table.add_users, [member for member in Bot._guild.members if not member.bot])
             
-    # start the review loop task
+    # index upcoming reminders, then start the review loop task
+    await asyncio.to_thread(Bot._table.build_review_queue)
     check_cards_for_review.start()
     
-    # load badge objects from json file
-    Bot._badge_data = class_badge.load_badges_from_json("badges.json")
-    
 
-@Bot._bot.event
 async def on_member_join(member):
     """
     Called when a Member joins a Guild.
@@ -235,43 +504,62 @@ async def on_member_join(member):
     """
     # add member to users table (if already exists, nothing happens)
     if not member.bot:
-        Bot._table.add_user(member)
+        await asyncio.to_thread(Bot._table.add_user, member)
 
-@Bot._bot.event
-async def on_reaction_add(reaction, user):
+async def on_raw_reaction_add(payload):
     """
-    Called when a Member joins a Guild.
+    Called when a reaction is added to any message, cached or not.
 
-    :param reaction: The reaction added to the message.
-    :param user: The user who reacted.
+    :param payload: The raw reaction event payload.
     """
 
-    # if non-bot member reacts and message contains embeds
-    if not user.bot and reaction.message.embeds:
-        embed = reaction.message.embeds[0]
-        
-        # SEARCH RESULT EMBED
-        if embed.footer and embed.footer.text.startswith('S'):
-            # create a flashcard from embed data
-            flashcard_obj = FlashcardObject( 
-                embed.footer.text[1:],
-                embed.title, 
-                embed.description,
-                embed.fields[0].name,
-                embed.fields[0].value
-            )
-            # add newly created flashcard as dict to flashcard set
-            if not Bot._table.add_flashcard_to_set(user, flashcard_obj.to_dict()):
+    if str(payload.emoji) != ADD_FLASHCARD_REACTION or payload.user_id == Bot._bot.user.id:
+        return
 
-                error_embed = discord.Embed(
-                    embed=discord.Embed(
-                        type="rich",
-                        title="Error",
-                        description=f"Cannot add flashcard. Maximum capacity of {Bot._table.max_capacity} reached.",
-                        color=0xFF6347
-                    )
-                )
-                await reaction.message.channel.send(embed=error_embed)
+    # guild reactions carry the member, DM reactions only the user ID
+    user = payload.member or Bot._bot.get_user(payload.user_id)
+    if user is None or user.bot:
+        return
+    channel = Bot._bot.get_channel(payload.channel_id) or await Bot._bot.fetch_channel(payload.channel_id)
+    
+    # SEARCH RESULT
+    search_obj = Bot._search_results.get(payload.message_id)
+    if search_obj is not None:
+        flashcard_obj = FlashcardObject(
+            search_obj.id,
+            search_obj.korean_word,
+            search_obj.korean_dfn,
+            search_obj.trans_word,
+            search_obj.trans_dfn
+        )
+    
+    # otherwise recover the search result from the message embed
+    else:
+        message = await channel.fetch_message(payload.message_id)
+        if message.author.id != Bot._bot.user.id or not message.embeds:
+            return
+        embed = message.embeds[0]
+        
+        if not (embed.footer and embed.footer.text and embed.footer.text.startswith('S')):
+            return
+        # create a flashcard from embed data
+        flashcard_obj = FlashcardObject( 
+            embed.footer.text[1:],
+            embed.title, 
+            embed.description,
+            embed.fields[0].name,
+            embed.fields[0].value
+        )
+    
+    # add newly created flashcard as dict to flashcard set
+    if not await asyncio.to_thread(Bot._table.add_flashcard_to_set, user, flashcard_obj.to_dict()):
+        error_embed = discord.Embed(
+            type="rich",
+            title="Error",
+            description=f"Cannot add flashcard. Maximum capacity of {Bot._table.max_capacity} reached.",
+            color=0xFF6347
+        )
+        await channel.send(embed=error_embed)
 
 # TASKS
 
@@ -281,73 +569,34 @@ async def check_cards_for_review():
     Checks user flashcards for review at regular intervals and sends reminders to users.
     """
     
-    current_time = datetime.datetime.now()
-
-    # loop through all users in users table
-    all_users = Bot._table.get_all_users()
-    for user_entry in all_users:
-        reminder_packet = []
-
-        # access the flashcard set for the current user as a list
-        for flashcard_dict in user_entry["flashcard_set"].values():
-            
-            if not flashcard_dict["spaced_repetition"]["to_review"]:
-                last_reviewed_str = flashcard_dict["spaced_repetition"].get("last_reviewed")
-                if last_reviewed_str is None:
-                    continue
-                
-                last_reviewed = datetime.datetime.fromisoformat(last_reviewed_str)
-                interval_minutes = int(flashcard_dict["spaced_repetition"]["interval"])  # Convert to integer
+    current_time = int(time.time())
 
-                if (current_time - last_reviewed >= datetime.timedelta(minutes=interval_minutes)):
-                    flashcard_dict["spaced_repetition"]["to_review"] = True
-                    flashcard_dict["spaced_repetition"]["last_reminded"] = current_time.isoformat()
-                    reminder_packet.append(flashcard_dict)
-            else:
-                last_reminded_str = flashcard_dict["spaced_repetition"].get("last_reminded")
-                if last_reminded_str is None:
-                    continue
-                
-                last_reminded = datetime.datetime.fromisoformat(last_reminded_str)
-            
-                if (current_time - last_reminded >= datetime.timedelta(days=1)):
-                    flashcard_dict["spaced_repetition"]["last_reminded"] = current_time.isoformat()
-                    reminder_packet.append(flashcard_dict)
-        
-        # send packet of cards to review if not empty
-        if not user_entry["preferences"]["notifications"]:
-            continue
-        
-        if reminder_packet:
-            user_id = user_entry["id"]
-            user = Bot._bot.get_user(user_id)
-            user_dm_channel = await user.create_dm()
-            
-            flashcard_list = []
-            for flashcard_dict in reminder_packet:
-                flashcard_list.append(f'• {flashcard_dict["front"]["word"]} / {flashcard_dict["back"]["word"]}')
-    
-            reminder_embed = discord.Embed.from_dict(
-                {
-                    "type": "rich",
-                    "title": "It's time to review these flashcards!",
-                    "description": '\n'.join(flashcard_list),
-                    "color": 0x5865f2,
-                    "footer": {
-                        "text": f'{len(flashcard_list)} flashcard{"" if len(flashcard_list) == 1 else "s"}'
-                    }
-                }
-            )
-            await user_dm_channel.send(embed=reminder_embed)
-            
-            # update the flashcard data in the database
+    # only users with queued flashcards that have come due are looked up
+    due_flashcards = []
+    for user_id, flashcard_ids in Bot._table.pop_due_flashcards(current_time).items():
+        user = Bot._bot.get_user(user_id)
+        if user is not None:
+            due_flashcards.append((user, flashcard_ids))
+    
+    # the table reads and card checks block, so they run off the event loop
+    reminders = await asyncio.to_thread(collect_reminder_packets, due_flashcards, current_time)
+    
+    # send the reminders concurrently so one failed DM doesn't hold up or abort the rest
+    results = await asyncio.gather(
+        *(send_reminder(user, reminder_packet) for user, reminder_packet in reminders),
+        return_exceptions=True
+    )
+    for (user, reminder_packet), result in zip(reminders, results):
+        if isinstance(result, Exception):
+            logging.error(f"Couldn't send review reminder to user {user.id}: {result}")
+            # the cards were already popped from the queue, so queue them again to retry on the next tick
             for flashcard_dict in reminder_packet:
-                Bot._table.update_flashcard(user, flashcard_dict)
+                Bot._table.schedule_review(user.id, flashcard_dict, reminder_time=current_time)
 
 
 # COMMANDS
 
-@Bot._bot.command(aliases=['s', '검색', 'ㄱ'], category="Search")
+@commands.command(aliases=['s', '검색', 'ㄱ'], category="Search")
 async def search(ctx, word):
     """
     Searches for the given word in the Korean dictionary and displays the search results.
@@ -362,7 +611,7 @@ async def search(ctx, word):
         !search 나무
     """
     
-    search_objects = korean_dictionary.get_search_results(word)
+    search_objects = await korean_dictionary.get_search_results(word, Bot._http_session)
     
     # if an error string
     if isinstance(search_objects, str):
@@ -380,28 +629,26 @@ async def search(ctx, word):
     elif search_objects:
         embeds = []
         for search_obj in search_objects:
-            response_embed = discord.Embed.from_dict(
-                {
-                    "type": "rich",
-                    "title": f'{search_obj.korean_word}',
-                    "description": f'{search_obj.korean_dfn}',
-                    "color": 0x5865f2,
-                    "fields": [
-                        {
-                        "name": f'{search_obj.trans_word}',
-                        "value": f'{search_obj.trans_dfn}'
-                        }
-                    ],
-                    "footer": {
-                        "text": f'S{search_obj.id}'
-                    }
-                }
-            )
-            embeds.append(response_embed)
+            response_dict = SEARCH_RESULT_TEMPLATE.copy()
+            response_dict["title"] = f'{search_obj.korean_word}'
+            response_dict["description"] = f'{search_obj.korean_dfn}'
+            response_dict["fields"] = [
+                {"name": f'{search_obj.trans_word}', "value": f'{search_obj.trans_dfn}'}
+            ]
+            response_dict["footer"] = {"text": f'S{search_obj.id}'}
+            embeds.append(discord.Embed.from_dict(response_dict))
                   
-        for embed in embeds:
+        # results are sent one at a time to keep them in order, while each
+        # add reaction runs alongside the sends that follow it
+        reaction_tasks = []
+        for search_obj, embed in zip(search_objects, embeds):
             message = await ctx.send(embed=embed)
-            await message.add_reaction("📝")
+            reaction_tasks.append(asyncio.create_task(message.add_reaction(ADD_FLASHCARD_REACTION)))
+            
+            Bot._search_results[message.id] = search_obj
+            if len(Bot._search_results) > SEARCH_RESULT_CACHE_SIZE:
+                Bot._search_results.popitem(last=False)
+        await asyncio.gather(*reaction_tasks)
             
     else:
         await ctx.send(
@@ -413,7 +660,7 @@ async def search(ctx, word):
             )
         )
         
-@Bot._bot.command(aliases=['f', '플래시카드', 'ㅍ'], category="Flashcards")
+@commands.command(aliases=['f', '플래시카드', 'ㅍ'], category="Flashcards")
 async def flashcards(ctx, *args):
     """
     Displays the flashcard set belonging to the user.
@@ -433,7 +680,7 @@ async def flashcards(ctx, *args):
         !flashcards (animals)
     """
     
-    user_flashcard_list = list(Bot._table.get_flashcard_set(ctx.author).values())
+    user_flashcard_list = list((await asyncio.to_thread(Bot._table.get_flashcard_set, ctx.author)).values())
     
     # PARSE ARGUMENTS
     filters = []
@@ -449,8 +696,11 @@ async def flashcards(ctx, *args):
                 filters.append(FlashcardFilter(["label"], label))
         
     # apply filters
-    for filter in filters:
-        user_flashcard_list = filter.apply(user_flashcard_list)
+    if filters:
+        user_flashcard_list = [
+            flashcard for flashcard in user_flashcard_list
+            if all(filter_obj.matches(flashcard) for filter_obj in filters)
+        ]
         
     if not user_flashcard_list:
         await ctx.send(
@@ -463,34 +713,36 @@ async def flashcards(ctx, *args):
         )
         return
     
-    # generate list (String Builder) of flashcards
-    flashcard_display_list = []
-    for i, flashcard in enumerate(user_flashcard_list):
-        flashcard_display_list.append(f'[{i+1}]\t{flashcard["front"]["word"]} / {flashcard["back"]["word"]}')
-    
+    # generate list of flashcards
+    num_flashcards = len(user_flashcard_list)
     flashcard_set_embed = discord.Embed.from_dict(
         {
             "type": "rich",
             "title": f"{ctx.author}'s Flashcard Set",
-            "description": '\n'.join(flashcard_display_list),
+            "description": '\n'.join(
+                f'[{i}]\t{flashcard["front"]["word"]} / {flashcard["back"]["word"]}'
+                for i, flashcard in enumerate(user_flashcard_list, start=1)
+            ),
             "color": 0x5865f2,
             "footer": {
-                "text": f'{len(flashcard_display_list)} flashcard{"" if len(flashcard_display_list) == 1 else "s"}'
+                "text": f'{num_flashcards} {pluralize("flashcard", num_flashcards)}'
             }
         }
     )
     flashcard_list_message = await ctx.send(embed=flashcard_set_embed)
     
     # add reactions for labeling and deleting
-    await flashcard_list_message.add_reaction('🏷️')
-    await flashcard_list_message.add_reaction('🗑️')
+    reactions_task = asyncio.create_task(add_reactions(flashcard_list_message, ('🏷️', '🗑️')))
     
     try:
-        reaction, user = await Bot._bot.wait_for(
-            'reaction_add', 
-            timeout=60, 
-            check=lambda reaction, user: user == ctx.author and reaction.message.id == flashcard_list_message.id and str(reaction.emoji) in ['🏷️', '🗑️']
-        )
+        try:
+            reaction, user = await Bot._bot.wait_for(
+                'reaction_add', 
+                timeout=60, 
+                check=make_reaction_check(ctx.author.id, flashcard_list_message.id, FLASHCARD_SET_REACTIONS)
+            )
+        finally:
+            reactions_task.cancel()
         
         # LABEL LOGIC
         if str(reaction.emoji) == '🏷️':
@@ -506,11 +758,10 @@ async def flashcards(ctx, *args):
            
             # handle result
             result = await wait_for_cancel_reaction_or_message(ctx, user, label_prompt)
-            result = result.pop().result()
             await label_prompt.delete()
             
-            # cancel reaction received
-            if isinstance(result, tuple):
+            # timed out or cancel reaction received
+            if result is None or isinstance(result, tuple):
                 return
                             
             # parse label response
@@ -518,14 +769,14 @@ async def flashcards(ctx, *args):
             
             
             if label and flashcards_to_label:
-                Bot._table.label_flashcards(user, label, flashcards_to_label)
+                await asyncio.to_thread(Bot._table.label_flashcards, user, label, flashcards_to_label)
                 flashcards_to_label_str = ", ".join(map(str, flashcards_to_label))
                 
                 await ctx.send(
                     embed=discord.Embed(
                         type="rich",
                         title="Success",
-                        description=f'Labeled flashcard{"" if len(flashcards_to_label) == 1 else "s"} {flashcards_to_label_str} with the label \"{label}\"',
+                        description=f'Labeled {pluralize("flashcard", len(flashcards_to_label))} {flashcards_to_label_str} with the label \"{label}\"',
                         color=0x5865f2
                     )
                 )
@@ -553,25 +804,24 @@ async def flashcards(ctx, *args):
             
             # handle result
             result = await wait_for_cancel_reaction_or_message(ctx, user, label_prompt)
-            result = result.pop().result()
             await label_prompt.delete()
             
-            # cancel reaction received
-            if isinstance(result, tuple):
+            # timed out or cancel reaction received
+            if result is None or isinstance(result, tuple):
                 return
                             
             # parse label response
             flashcards_to_delete = parse_delete_input(result.content, len(user_flashcard_list))
             
             if flashcards_to_delete:
-                Bot._table.delete_flashcards(user, flashcards_to_delete)
+                await asyncio.to_thread(Bot._table.delete_flashcards, user, flashcards_to_delete)
                 flashcards_to_delete_str = ", ".join(map(str, flashcards_to_delete))
                 
                 await ctx.send(
                     embed=discord.Embed(
                         type="rich",
                         title="Success",
-                        description=f'Deleted flashcard{"" if len(flashcards_to_delete) == 1 else "s"} {flashcards_to_delete_str}',
+                        description=f'Deleted {pluralize("flashcard", len(flashcards_to_delete))} {flashcards_to_delete_str}',
                         color=0x5865f2
                     )
                 )
@@ -589,7 +839,7 @@ async def flashcards(ctx, *args):
         return
       
 
-@Bot._bot.command(aliases=['q', 'ㅋ', '퀴즈'], category="Quiz")
+@commands.command(aliases=['q', 'ㅋ', '퀴즈'], category="Quiz")
 async def quiz(ctx, *args):
     """
     Start a flashcard quiz session with optional filters.
@@ -631,7 +881,7 @@ async def quiz(ctx, *args):
             filters.append(FlashcardFilter(["label"], label, operation="!=" if arg.startswith("!(") else "=="))
     
     # retrieve random list of flashcards
-    flashcard_list = Bot._table.get_random_flashcards(ctx.author, num_cards, filters=filters)
+    flashcard_list = await asyncio.to_thread(Bot._table.get_random_flashcards, ctx.author, num_cards, filters=filters)
     
     # if no flashcards in set, send error
     if not flashcard_list:
@@ -646,11 +896,12 @@ async def quiz(ctx, *args):
         return
     
     # start of quiz message
+    num_flashcards = len(flashcard_list)
     await ctx.send(
         embed=discord.Embed(
             type="rich",
             title="Flashcard Quiz",
-            description=f"{len(flashcard_list)} flashcards",
+            description=f'{num_flashcards} {pluralize("flashcard", num_flashcards)}',
             color=0x5865f2
         )
     )
@@ -658,128 +909,98 @@ async def quiz(ctx, *args):
     points_earned = 0
     index = 0
     completed = False
+    # rated flashcards are saved together once the quiz ends
+    rated_flashcards = []
     
-    # begin iteration through flashcard list
-    while index < len(flashcard_list):
-        flashcard = flashcard_list[index]
-        flashcard_object = FlashcardObject.from_dict(flashcard)
+    try:
+        # begin iteration through flashcard list
+        while index < num_flashcards:
+            flashcard = flashcard_list[index]
+            flashcard_object = FlashcardObject.from_dict(flashcard)
 
-        # switch front and back if inverted
-        if inverted:
-            flashcard_object.invert()
-            flashcard = flashcard_object.to_dict()
-            flashcard_object.invert()
-        
-        flashcard_front = discord.Embed.from_dict(
-            {
-                "type": "rich",
-                "title": f'Flashcard - Front',
-                "color": 0xcccccc,
-                "fields": [
-                    {
-                        "name": f'{flashcard["front"]["word"]}',
-                        "value": f'{flashcard["front"]["dfn"]}'
-                    }
-                ],
-                "footer": {
-                    "text": f'F{flashcard["id"]}'
-                }
-            }
-        )
-        
-        # send flashcard front
-        message = await ctx.send(embed=flashcard_front)
-        await message.add_reaction("🔄")
-        await message.add_reaction("❌")
-        
-        # wait for reaction
-        try:
-            reaction_front, _ = await Bot._bot.wait_for(
-                "reaction_add",
-                check=lambda r, u: not u.bot and r.message.id == message.id and str(r.emoji) in ['🔄', '❌'] and u.id == ctx.author.id,
-                timeout=60
-            ) 
-        except asyncio.TimeoutError:
-            break
-
-        # end flashcard quiz option
-        if str(reaction_front.emoji) == '❌':
-            break
-        
-        flashcard_back = discord.Embed.from_dict(
-            {
-                "type": "rich",
-                "title": f'Flashcard - Back',
-                "color": 0xcccccc,
-                "fields": [
-                    {
-                        "name": f'{flashcard["front"]["word"]}',
-                        "value": f'{flashcard["front"]["dfn"]}'
-                    },
-                    {
-                        "name": f'{flashcard["back"]["word"]}',
-                        "value": f'{flashcard["back"]["dfn"]}'
-                    }
-                ],
-                "footer": {
-                    "text": f'B{flashcard["id"]}'
-                }
-            }
-        )
-        
-        # flip the flashcard
-        await message.clear_reactions()
-        await asyncio.sleep(1)
-        await message.edit(embed=flashcard_back)
-        await message.add_reaction("🟥")  
-        await message.add_reaction("🟨")  
-        await message.add_reaction("🟩") 
-        
-        # wait for reaction
-        try:
-            reaction_back, _ = await Bot._bot.wait_for(
-                "reaction_add",
-                check=lambda r, u: not u.bot and r.message.id == message.id and str(r.emoji) in ['🟥', '🟨', '🟩'] and u.id == ctx.author.id,
-                timeout=60
+            # switch front and back if inverted
+            if inverted:
+                flashcard = flashcard_object.to_dict(inverted=True)
+            
+            flashcard_front_dict = FLASHCARD_FRONT_TEMPLATE.copy()
+            flashcard_front_dict["fields"] = [
+                {"name": f'{flashcard["front"]["word"]}', "value": f'{flashcard["front"]["dfn"]}'}
+            ]
+            flashcard_front_dict["footer"] = {"text": f'F{flashcard["id"]}'}
+            flashcard_front = discord.Embed.from_dict(flashcard_front_dict)
+            
+            flashcard_back_dict = FLASHCARD_BACK_TEMPLATE.copy()
+            flashcard_back_dict["fields"] = [
+                {"name": f'{flashcard["front"]["word"]}', "value": f'{flashcard["front"]["dfn"]}'},
+                {"name": f'{flashcard["back"]["word"]}', "value": f'{flashcard["back"]["dfn"]}'}
+            ]
+            flashcard_back_dict["footer"] = {"text": f'B{flashcard["id"]}'}
+            flashcard_back = discord.Embed.from_dict(flashcard_back_dict)
+            
+            # send flashcard front, which the flip button turns over to the back and its rating buttons
+            rating_buttons = QuizButtons(ctx.author.id, RATING_BUTTONS)
+            front_buttons = QuizButtons(
+                ctx.author.id,
+                FRONT_BUTTONS,
+                responses={FRONT_BUTTONS[0]: {"embed": flashcard_back, "view": rating_buttons}}
             )
-        except asyncio.TimeoutError:
-            break
-        
-        else:
+            message = await ctx.send(embed=flashcard_front, view=front_buttons)
+            
+            # wait for button press
+            if await front_buttons.wait():
+                await message.edit(view=None)
+                break
+
+            # end flashcard quiz option
+            if front_buttons.pressed == '❌':
+                break
+            
+            # flip the flashcard here if the press's own response didn't go through, so the rating buttons are attached
+            if front_buttons.value is None:
+                await message.edit(embed=flashcard_back, view=rating_buttons)
+            
+            # wait for button press
+            if await rating_buttons.wait():
+                await message.edit(view=None)
+                break
+            
             # based on user rating, update user points and flashcard spaced repetition data
-            points_earned += flashcard_object.process_rating(reaction_back)
-            Bot._table.update_flashcard(ctx.author, flashcard_object.to_dict())
+            points_earned += flashcard_object.process_rating(RATING_BUTTONS[rating_buttons.pressed])
+            rated_flashcards.append(flashcard_object.to_dict())
             
             # increment to next flashcard in quiz
             index += 1
             
             # check for completion
-            if index == len(flashcard_list):
+            if index == num_flashcards:
                 completed = True 
-            await asyncio.sleep(1)
-            
+    finally:
+        # save the spaced repetition data of every rated flashcard in one write, even if the quiz ended early
+        if rated_flashcards:
+            await asyncio.to_thread(Bot._table.update_flashcard_reviews, ctx.author, rated_flashcards)
+    
     # update user progress fields
+    progress_deltas = {"flashcards_studied": index, "study_points": points_earned}
     if completed:
-        Bot._table.update_user_number_progress(ctx.author, "quizzes_completed", 1)
-    Bot._table.update_user_number_progress(ctx.author, "flashcards_studied", index)
-    Bot._table.update_user_number_progress(ctx.author, "study_points", points_earned)
+        progress_deltas["quizzes_completed"] = 1
+    user_progress = await asyncio.to_thread(Bot._table.update_user_progress, ctx.author, progress_deltas, return_progress=True)
 
     await ctx.send(
         embed=discord.Embed(
             type="rich",
             title='Flashcard Quiz Ended',
-            description=f'{index} flashcard{"" if index == 1 else "s"} studied\n{points_earned} point{"" if points_earned == 1 else "s"} earned',
+            description=f'{index} {pluralize("flashcard", index)} studied\n{points_earned} {pluralize("point", points_earned)} earned',
             color=0x5865f2,
         )
     )
     
     # check for appropriate badges
-    user_progress = Bot._table.get_user(ctx.author)["progress"]
+    earned_badge_names = {b['name'] for b in user_progress["badges"]}
     
     for badge in Bot._badge_data:
         # check that badge is not already earned
-        if badge.name not in [b['name'] for b in user_progress["badges"]] and badge.check_completion(user_progress):
-            Bot._table.add_badge_to_badges(ctx.author, badge)
+        if badge.name not in earned_badge_names and badge.check_completion(user_progress):
+            await asyncio.to_thread(Bot._table.add_badge_to_badges, ctx.author, badge)
             await ctx.send(
                 embed=discord.Embed(
                     type="rich",
@@ -789,7 +1010,7 @@ async def quiz(ctx, *args):
                 )
             )
 
-@Bot._bot.command(aliases=["t", "ㅌ", "통계"])
+@commands.command(aliases=["t", "ㅌ", "통계"])
 async def stats(ctx):
     """
     View your stats and badges.
@@ -798,7 +1019,7 @@ async def stats(ctx):
         !stats
     """
     
-    user_progress_data = Bot._table.get_user(ctx.author)["progress"]
+    user_progress_data = (await asyncio.to_thread(Bot._table.get_user, ctx.author, attributes=("progress",)))["progress"]
     order = ["study_points", "flashcards_studied", "quizzes_completed", "current_streak", "longest_streak", "badges"]
 
     
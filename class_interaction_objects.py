@@ -12,6 +12,8 @@ SearchObject Methods:
 FlashcardObject Methods:
     __init__: Initializes a FlashcardObject instance.
     from_dict: Constructs a FlashcardObject instance from a dictionary.
+    parse_timestamp: Converts a stored review timestamp to Unix seconds.
+    next_reminder_time: Calculates when a reminder is next due for a flashcard.
     to_dict: Converts a FlashcardObject instance to a dictionary.
     invert: Swaps the information on front and back of the flashcard.
     calculate_points: Calculates the points earned based on the user's rating.
@@ -22,12 +24,15 @@ FlashcardObject Methods:
 """
 
 import datetime
+import time
 
 class SearchObject:
     """
     Represents the resulting data from a dictionary search.
     """
     
+    __slots__ = ('id', 'korean_word', 'korean_dfn', 'trans_word', 'trans_dfn')
+    
     def __init__(self, id, korean_word, korean_dfn, trans_word, trans_dfn):
         """
         Initializes a SearchObject instance with the provided data.
@@ -52,7 +57,13 @@ class SearchObject:
         :return: A dictionary representation of the SearchObject instance.
         """
         
-        return vars(self)
+        return {
+            "id": self.id,
+            "korean_word": self.korean_word,
+            "korean_dfn": self.korean_dfn,
+            "trans_word": self.trans_word,
+            "trans_dfn": self.trans_dfn
+        }
     
     
 class FlashcardObject:
@@ -60,10 +71,12 @@ class FlashcardObject:
     Represents a flashcard object with spaced repetition data.
 
     Attributes:
+        POOR, OKAY, GOOD (int): Rating codes accepted by process_rating.
         LEARNING_THRESHOLD (datetime.timedelta): The threshold for considering a flashcard in the learning phase.
         MIN_INTERVAL (datetime.timedelta): The minimum interval between reviews.
         MAX_INTERVAL (datetime.timedelta): The maximum interval between reviews.
         INITIAL_INTERVAL (datetime.timedelta): The initial interval for a flashcard.
+        REMINDER_INTERVAL (datetime.timedelta): The time before a reminder is repeated for a card still to be reviewed.
         FACTORS (dict): Dictionary containing factors for different rating levels.
             Keys: Rating levels ('Good', 'Okay', 'Poor')
             Values: Dictionaries containing factors for learning and review phases.
@@ -73,6 +86,8 @@ class FlashcardObject:
     Methods:
         __init__: Initializes a FlashcardObject instance.
         from_dict: Creates a FlashcardObject instance from a dictionary.
+        parse_timestamp: Converts a stored review timestamp to Unix seconds.
+        next_reminder_time: Calculates when a reminder is next due for a flashcard.
         to_dict: Converts the FlashcardObject instance to a dictionary.
         invert: Inverts the front and back sides of the flashcard.
         calculate_factor: Calculates the factor based on the user's rating.
@@ -81,10 +96,20 @@ class FlashcardObject:
         process_rating: Processes the user's rating and updates spaced repetition data.
     """
     
+    __slots__ = ('id', 'front_word', 'front_dfn', 'back_word', 'back_dfn', 'label', 'spaced_repetition')
+    
     LEARNING_THRESHOLD = datetime.timedelta(minutes=60)
     MIN_INTERVAL = datetime.timedelta(minutes=10)
-    MAX_INTERVAL = datetime.timedelta(days=30)
+    MAX_INTERVAL = datetime.timedelta(weeks=1)
     INITIAL_INTERVAL = datetime.timedelta(minutes=10)
+    REMINDER_INTERVAL = datetime.timedelta(days=1)
+    
+    # the same bounds in minutes, the unit stored in spaced_repetition["interval"]
+    _LEARNING_THRESHOLD_MINUTES = int(LEARNING_THRESHOLD.total_seconds() // 60)
+    _MIN_INTERVAL_MINUTES = int(MIN_INTERVAL.total_seconds() // 60)
+    _MAX_INTERVAL_MINUTES = int(MAX_INTERVAL.total_seconds() // 60)
+    _INITIAL_INTERVAL_MINUTES = int(INITIAL_INTERVAL.total_seconds() // 60)
+    _REMINDER_INTERVAL_SECONDS = int(REMINDER_INTERVAL.total_seconds())
     
     FACTORS = {
         "Good": {"Learning": 3, "Review": 3.5},
@@ -92,6 +117,17 @@ class FlashcardObject:
         "Poor": {"Learning": 0.5, "Review": 0.75}
     }
     
+    # rating codes accepted by process_rating
+    POOR, OKAY, GOOD = 0, 1, 2
+    
+    # points and FACTORS indexed by rating code; factors are (Review, Learning) tuples indexed by the learning_phase flag
+    _RATING_POINTS = (0, 1, 3)
+    _RATING_FACTORS = (
+        (FACTORS["Poor"]["Review"], FACTORS["Poor"]["Learning"]),
+        (FACTORS["Okay"]["Review"], FACTORS["Okay"]["Learning"]),
+        (FACTORS["Good"]["Review"], FACTORS["Good"]["Learning"])
+    )
+    
     def __init__(self, id, korean_word, korean_dfn, trans_word, trans_dfn, label=None, spaced_repetition=None):
         """
         Initializes a FlashcardObject instance.
@@ -105,20 +141,17 @@ class FlashcardObject:
         """
         
         self.id = id
-        self.front = {
-            "word": korean_word,
-            "dfn": korean_dfn
-        }
-        self.back = {
-            "word": trans_word,
-            "dfn": trans_dfn
-        }
+        # the sides are stored flat and only nested into front/back dicts by to_dict
+        self.front_word = korean_word
+        self.front_dfn = korean_dfn
+        self.back_word = trans_word
+        self.back_dfn = trans_dfn
         self.label = label
         self.spaced_repetition = spaced_repetition or {
             "to_review": False,
             "last_reviewed": None,
             "last_reminded": None,
-            "interval": self.INITIAL_INTERVAL.total_seconds() // 60,
+            "interval": self._INITIAL_INTERVAL_MINUTES,
             "learning_phase": True,
             "times_studied": 0
         }
@@ -132,6 +165,14 @@ class FlashcardObject:
         :return: FlashcardObject instance.
         """
         
+        # copied so rating the flashcard doesn't change the dictionary it was read from
+        spaced_repetition = dict(flashcard_dict.get('spaced_repetition', {}))
+        
+        # migrate timestamps stored as ISO strings by older versions to Unix seconds
+        for key in ("last_reviewed", "last_reminded"):
+            if isinstance(spaced_repetition.get(key), str):
+                spaced_repetition[key] = cls.parse_timestamp(spaced_repetition[key])
+        
         return cls(
             flashcard_dict['id'],
             flashcard_dict['front']['word'],
@@ -139,32 +180,67 @@ class FlashcardObject:
             flashcard_dict['back']['word'],
             flashcard_dict['back']['dfn'],
             flashcard_dict['label'],
-            flashcard_dict.get('spaced_repetition', {})
+            spaced_repetition
         )
         
-    def to_dict(self):
+    @staticmethod
+    def parse_timestamp(value):
+        """
+        Converts a stored review timestamp to whole Unix seconds.
+
+        :param value: Unix seconds (int or Decimal), a legacy ISO 8601 string, or None.
+        :return: The timestamp as an int, or None if no timestamp is stored.
+        """
+        
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return int(datetime.datetime.fromisoformat(value).timestamp())
+        return int(value)
+    
+    @classmethod
+    def next_reminder_time(cls, spaced_repetition):
+        """
+        Calculates when a reminder is next due for a flashcard.
+        
+        A card waiting to be reviewed is due when its interval has passed since it was last reviewed.
+        A card that has already been reminded is due again once the reminder interval has passed.
+
+        :param spaced_repetition: The spaced repetition data of the flashcard.
+        :return: The due time in Unix seconds, or None if the card has never been studied.
+        """
+        
+        if not spaced_repetition["to_review"]:
+            last_reviewed = cls.parse_timestamp(spaced_repetition.get("last_reviewed"))
+            if last_reviewed is None:
+                return None
+            return last_reviewed + int(spaced_repetition["interval"]) * 60
+        
+        last_reminded = cls.parse_timestamp(spaced_repetition.get("last_reminded"))
+        if last_reminded is None:
+            return None
+        return last_reminded + cls._REMINDER_INTERVAL_SECONDS
+        
+    def to_dict(self, inverted=False):
         """
         Converts the FlashcardObject instance to a dictionary.
 
+        :param inverted: Optional. Swap the front and back sides in the returned dictionary without inverting the flashcard itself.
         :return: Dictionary representation of the FlashcardObject instance.
         """
         
-        # Create a copy of the spaced_repetition dictionary
-        spaced_repetition_copy = self.spaced_repetition.copy()
-
-        # Convert last_reviewed datetime to string format
-        if (spaced_repetition_copy["last_reviewed"] is not None) and (not isinstance(spaced_repetition_copy["last_reviewed"], str)):
-            spaced_repetition_copy["last_reviewed"] = spaced_repetition_copy["last_reviewed"].isoformat()
-            
-        spaced_repetition_copy["interval"] = int(spaced_repetition_copy["interval"])
+        front = {"word": self.front_word, "dfn": self.front_dfn}
+        back = {"word": self.back_word, "dfn": self.back_dfn}
+        if inverted:
+            front, back = back, front
 
-        # Return the dictionary representation of the FlashcardObject
+        # Return the dictionary representation of the FlashcardObject, with its own copy of the spaced repetition data
         return {
             "id": self.id,
-            "front": self.front,
-            "back": self.back,
+            "front": front,
+            "back": back,
             "label": self.label,
-            "spaced_repetition": spaced_repetition_copy
+            "spaced_repetition": dict(self.spaced_repetition, interval=int(self.spaced_repetition["interval"]))
         }
     
     def invert(self):
@@ -172,42 +248,29 @@ class FlashcardObject:
         Inverts the front and back sides of the flashcard.
         """
         
-        temp = self.front
-        self.front = self.back
-        self.back = temp  
+        self.front_word, self.front_dfn, self.back_word, self.back_dfn = (
+            self.back_word, self.back_dfn, self.front_word, self.front_dfn
+        )
         
     def calculate_points(self, rating):
         """
         Calculates the points earned based on the user's rating.
 
-        :param rating: User's rating.
+        :param rating: User's rating code (POOR, OKAY or GOOD).
         :return: Points earned from rating.
         """
         
-        rating_to_points = {
-            '🟩': 3,
-            '🟨': 1,
-            '🟥': 0
-        }
-        
-        return rating_to_points[rating.emoji]
+        return self._RATING_POINTS[rating]
         
     def calculate_factor(self, rating):
         """
         Calculates the factor based on the user's rating.
 
-        :param rating: User's rating.
+        :param rating: User's rating code (POOR, OKAY or GOOD).
         :return: Factor for spaced repetition.
         """
-        flashcard_phase = "Learning" if self.spaced_repetition["learning_phase"] else "Review"
         
-        rating_to_factor = {
-            '🟩': self.FACTORS["Good"][flashcard_phase],
-            '🟨': self.FACTORS["Okay"][flashcard_phase],
-            '🟥': self.FACTORS["Poor"][flashcard_phase]
-        }
-        
-        return rating_to_factor[rating.emoji]
+        return self._RATING_FACTORS[rating][bool(self.spaced_repetition["learning_phase"])]
         
     
     def update_interval(self, factor):
@@ -217,9 +280,8 @@ class FlashcardObject:
         :param factor: The interval factor.
         """
         
-        new_interval = int(self.spaced_repetition['interval']) * factor
-        self.spaced_repetition['interval'] = min(new_interval, int(self.MAX_INTERVAL.total_seconds() / 60))
-        self.spaced_repetition['interval'] = max(new_interval, int(self.MIN_INTERVAL.total_seconds() / 60))
+        new_interval = int(int(self.spaced_repetition['interval']) * factor)
+        self.spaced_repetition['interval'] = max(self._MIN_INTERVAL_MINUTES, min(new_interval, self._MAX_INTERVAL_MINUTES))
     
     def update_learning_phase(self):
         """
@@ -227,21 +289,20 @@ class FlashcardObject:
 
         """
         
-        learning_threshold_minutes = int(self.LEARNING_THRESHOLD.total_seconds() / 60)
-        self.spaced_repetition["learning_phase"] = self.spaced_repetition['interval'] < learning_threshold_minutes
+        self.spaced_repetition["learning_phase"] = self.spaced_repetition['interval'] < self._LEARNING_THRESHOLD_MINUTES
        
     def process_rating(self, rating):
         """
         Processes the rating given to the flashcard.
 
-        :param rating: The rating given to the flashcard.
+        :param rating: The rating code given to the flashcard (POOR, OKAY or GOOD).
         """
         
         factor = self.calculate_factor(rating)
         self.update_interval(factor)
         self.update_learning_phase()
         self.spaced_repetition['to_review'] = False
-        self.spaced_repetition['last_reviewed'] = datetime.datetime.now().isoformat()
+        self.spaced_repetition['last_reviewed'] = int(time.time())
         self.spaced_repetition['times_studied'] += 1
         
         points_earned = self.calculate_points(rating)
@@ -249,6 +310,16 @@ class FlashcardObject:
         return points_earned
     
 class FlashcardFilter:
+    COMPARISON_OPERATIONS = {
+        "==": lambda x, y: x == y,
+        "!=": lambda x, y: x != y,
+        ">": lambda x, y: x > y,
+        "<": lambda x, y: x < y,
+        ">=": lambda x, y: x >= y,
+        "<=": lambda x, y: x <= y,
+        "not": lambda x, y: x is not y
+    }
+    
     def __init__(self, value_path, filter_value, operation=None):
         """
         Initializes a FlashcardFilter instance.
@@ -261,36 +332,30 @@ class FlashcardFilter:
         self.filter_value = filter_value
         self.operation = operation
 
-    def apply(self, flashcard_list):
+    def matches(self, flashcard):
         """
-        Applies the filter to a dictionary of flashcards.
+        Checks whether a single flashcard passes the filter.
 
-        :param flashcard_set: Dictionary of flashcards.
-        :return: Filtered flashcards.
+        :param flashcard: Dictionary representation of a flashcard.
+        :return: True if the flashcard passes the filter, False otherwise.
         """
         
-        filtered_flashcards = []
-        comparison_operations = {
-            "==": lambda x, y: x == y,
-            "!=": lambda x, y: x != y,
-            ">": lambda x, y: x > y,
-            "<": lambda x, y: x < y,
-            ">=": lambda x, y: x >= y,
-            "<=": lambda x, y: x <= y,
-            "not": lambda x, y: x is not y
-        }
+        value = flashcard
+        # traverse value path and check if valid
+        for key in self.value_path:
+            value = value.get(key)
+            if value is None:
+                return False
+        
+        comparison = self.COMPARISON_OPERATIONS.get(self.operation or "==")
+        return comparison is not None and comparison(value, self.filter_value)
 
-        for flashcard in flashcard_list:
-            value = flashcard
-            # traverse value path and check if valid
-            for key in self.value_path:
-                value = value.get(key)
-                if value is None:
-                    break
-            if value is not None:
-                comparison_op = self.operation or "=="
-                if comparison_op in comparison_operations:
-                    if comparison_operations[comparison_op](value, self.filter_value):
-                        filtered_flashcards.append(flashcard)
+    def apply(self, flashcard_list):
+        """
+        Applies the filter to a list of flashcards.
 
-        return filtered_flashcards
+        :param flashcard_list: List of flashcard dictionaries.
+        :return: Filtered flashcards.
+        """
+        
+        return [flashcard for flashcard in flashcard_list if self.matches(flashcard)]
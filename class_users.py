@@ -5,38 +5,123 @@ Classes:
     Users: Represents a DynamoDB table of Discord channel user data.
 
 Methods:
-    __init__: Initializes the Users instance with a Boto3 DynamoDB resource.
+    __init__: Initializes the Users instance with a function that creates Boto3 DynamoDB resources.
+    dyn_resource: The calling thread's Boto3 DynamoDB resource.
+    table: The calling thread's Table resource for the table in use.
     exists: Determines whether a table exists.
     create_table: Creates a new DynamoDB table for storing user data.
     delete_table: Deletes the DynamoDB table.
     get_all_users: Fetchesall user entries from the DynamoDB table.
+    iter_all_users: Yields every user entry in the DynamoDB table, one scan page at a time.
+    iter_user_pages: Scans the DynamoDB table one page of user entries at a time.
     get_user: Retrieves data entry for a specific user from the DynamoDB table.
+    new_user_item: Builds the initial table entry for a user.
     add_user: Adds a user to the DynamoDB table if not already in table.
+    add_users: Adds several users to the DynamoDB table with batched requests, skipping existing users.
     get_flashcard_by_id: Retrieves a flashcard by its ID for a specific user.
+    get_cached_flashcard_set: Retrieves a user's flashcard set from memory if it is cached.
+    cache_flashcard_set: Stores a user's flashcard set in the bounded in-memory cache.
+    drop_cached_flashcard_set: Removes a user's flashcard set from the in-memory cache after a write.
+    flashcard_set_lock: Gets the lock that serializes reads and writes of a user's flashcard set.
     get_flashcard_set: Retrieves the flashcard set for a specific user.
     get_random_flashcards: Retrieves a specified number of random flashcards for a user.
     add_flashcard_to_set: Adds a word object to the flashcard set for a user in the table.
     update_flashcard: Updates a flashcard in the user's flashcard set.
+    update_flashcards: Updates several flashcards in the user's flashcard set with a single write.
+    update_flashcard_reviews: Saves the spaced repetition data of reviewed flashcards that still exist.
     update_user_points: Updates the study points for a specific user.
+    update_user_progress: Adds to several progress counters for a specific user with a single write.
+    build_review_queue: Rebuilds the queue of upcoming flashcard reminders from the table.
+    schedule_review: Queues the next reminder for a flashcard.
+    pop_due_flashcards: Removes and returns the queued flashcards whose reminders are due.
 """
 
+import heapq
 import logging
 import random
+import threading
+import time
+from collections import OrderedDict
 from botocore.exceptions import ClientError
+from class_interaction_objects import FlashcardObject
 
 logger = logging.getLogger(__name__)
 
+# bounds on the in-memory flashcard sets; a set only needs to live for the reads of one command,
+# so anything another process wrote is seen within a few seconds
+FLASHCARD_SET_CACHE_SIZE = 512
+FLASHCARD_SET_CACHE_TTL = 5
+# number of locks that users' flashcard set reads and writes are spread over
+FLASHCARD_SET_LOCK_COUNT = 64
+# seconds to back off before resending unprocessed batch keys, doubling up to the maximum
+BATCH_RETRY_BASE_DELAY = 0.05
+BATCH_RETRY_MAX_DELAY = 5
+
 class Users:
     """Encapsulates an Amazon DynamoDB table of Discord channel user data."""
 
-    def __init__(self, dyn_resource):
+    def __init__(self, resource_factory):
         """
-        :param dyn_resource: A Boto3 DynamoDB resource.
+        :param resource_factory: A function that returns a new Boto3 DynamoDB resource. Boto3 resources
+            aren't thread-safe and table calls run on worker threads, so each thread is given its own.
         """
-        self.dyn_resource = dyn_resource
-        self.table = None
+        self.resource_factory = resource_factory
+        # the name of the table in use; each thread reaches it through its own resource
+        self.table_name = None
+        self._thread_resources = threading.local()
         self.max_capacity = 100
+        # min-heap of (next reminder time, user id, flashcard id) entries
+        self.review_queue = []
+        # the queue is updated from the event loop and from worker threads
+        self._review_queue_lock = threading.Lock()
+        # recently used flashcard sets, least recently used first, as user id: (expiry time, flashcard set),
+        # dropped on every flashcard set write so the next read sees the table's copy
+        self.flashcard_set_cache = OrderedDict()
+        self._flashcard_set_cache_lock = threading.Lock()
+        # table calls run on worker threads, so each user's flashcard set reads and writes take turns;
+        # reentrant because label_flashcards and delete_flashcards read the set while writing it
+        self._flashcard_set_locks = [threading.RLock() for _ in range(FLASHCARD_SET_LOCK_COUNT)]
 
+    @property
+    def dyn_resource(self):
+        """
+        The calling thread's Boto3 DynamoDB resource, created the first time the thread uses it.
+        """
+        
+        thread_resources = self._thread_resources
+        if not hasattr(thread_resources, "dyn_resource"):
+            thread_resources.dyn_resource = self.resource_factory()
+            thread_resources.tables = {}
+        return thread_resources.dyn_resource
+    
+    @property
+    def table(self):
+        """
+        The calling thread's Table resource for the table in use, or None if no table is in use.
+        """
+        
+        if self.table_name is None:
+            return None
+        
+        dyn_resource = self.dyn_resource
+        tables = self._thread_resources.tables
+        table = tables.get(self.table_name)
+        if table is None:
+            table = tables[self.table_name] = dyn_resource.Table(self.table_name)
+        return table
+    
+    @table.setter
+    def table(self, table):
+        # the table was made from the calling thread's resource, so that thread keeps using it
+        if table is None:
+            self.table_name = None
+            return
+        
+        # make sure the calling thread's resources are set up before storing the table with them
+        self.dyn_resource
+        self._thread_resources.tables[table.name] = table
+        self.table_name = table.name
+    
     def exists(self, table_name):
         """
         Determines whether a table exists. As a side effect, stores the table in
@@ -87,10 +172,8 @@ class Users:
                     {"AttributeName": "id", "AttributeType": "N"},
                     {"AttributeName": "name", "AttributeType": "S"},
                 ],
-                ProvisionedThroughput={
-                    "ReadCapacityUnits": 1,
-                    "WriteCapacityUnits": 1,
-                },
+                # on-demand capacity absorbs bursts of commands instead of throttling them
+                BillingMode="PAY_PER_REQUEST",
             )
             self.table.wait_until_exists()
             
@@ -125,20 +208,52 @@ class Users:
         """
         Fetch all user entries from the DynamoDB table.
         """
-        response = self.table.scan()
-        return response.get('Items', [])
+        return list(self.iter_all_users())
+
+    def iter_all_users(self):
+        """
+        Yields every user entry in the DynamoDB table, reading one scan page at a time.
+        
+        A single scan stops at 1 MB of data, so the remaining pages are followed as they are needed.
+        """
+        for user_page in self.iter_user_pages():
+            yield from user_page
 
-    def get_user(self, user):
+    def iter_user_pages(self, page_size=100):
+        """
+        Scans the DynamoDB table a page at a time, so only one page of user entries is held at once.
+
+        :param page_size: Optional. The maximum number of user entries to read per scan request.
+        :return: A generator of lists of user entries.
+        """
+        scan_kwargs = {"Limit": page_size}
+        while True:
+            response = self.table.scan(**scan_kwargs)
+            yield response.get('Items', [])
+            
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def get_user(self, user, attributes=None):
         """
         Gets tabular data entry for a specific user.
 
         :param user: The user to get.
+        :param attributes: Optional. The top-level attributes to read; all attributes are read if not given.
         :return: The data about the requested user.
         """
+        get_kwargs = {}
+        if attributes:
+            # only the requested attributes are sent back by DynamoDB
+            get_kwargs["ProjectionExpression"] = ", ".join(f"#attr{i}" for i in range(len(attributes)))
+            get_kwargs["ExpressionAttributeNames"] = {f"#attr{i}": attribute for i, attribute in enumerate(attributes)}
+        
         try:
             response = self.table.get_item(
                 Key={"id": user.id, "name": user.name},
-                TableName=self.table.name
+                TableName=self.table.name,
+                **get_kwargs
             )
         except ClientError as err:
             logger.error(
@@ -156,45 +271,106 @@ class Users:
             else:
                 return None 
         
+    @staticmethod
+    def new_user_item(user):
+        """
+        Builds the table entry for a user who has not been added yet.
+
+        :param user: Discord user object.
+        :return: The user's initial table entry.
+        """
+        # user schema
+        return {
+            "id": user.id,
+            "name": user.name,
+            "preferences": {
+                "notifications": True
+            },
+            "progress": {
+                "study_points": 0,
+                "flashcards_studied": 0,
+                "quizzes_completed": 0,
+                "last_quiz_completion": None,
+                "current_streak": 0,
+                "longest_streak": 0,
+                "badges": []
+            },
+            "flashcard_set": {}
+        }
+
     def add_user(self, user):
         """
         Adds a user to the table if not already in table.
 
         :param user: Discord user object.
         """
-        if not self.get_user(user):
-            try:
-                # user schema
-                self.table.put_item(
-                    Item={
-                        "id": user.id,
-                        "name": user.name,
-                        "preferences": {
-                            "notifications": True
-                        },
-                        "progress": {
-                            "study_points": 0,
-                            "flashcards_studied": 0,
-                            "quizzes_completed": 0,
-                            "last_quiz_completion": None,
-                            "current_streak": 0,
-                            "longest_streak": 0,
-                            "badges": []
-                        },
-                        "flashcard_set": {}
-                    },
-                    TableName=self.table.name
-                )
+        try:
+            # the condition leaves an existing user's entry untouched, so no read is needed first
+            self.table.put_item(
+                Item=self.new_user_item(user),
+                TableName=self.table.name,
+                ConditionExpression="attribute_not_exists(#id)",
+                ExpressionAttributeNames={"#id": "id"}
+            )
+        
+        except ClientError as err:
+            if err.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return
+            logger.error(
+                "Couldn't add user %s to table %s. Here's why: %s: %s",
+                user,
+                self.table.name,
+                err.response["Error"]["Code"],
+                err.response["Error"]["Message"],
+            )
+            raise
+
+    def add_users(self, users):
+        """
+        Adds any of several users to the table that are not already in table, in batched requests.
+
+        :param users: An iterable of Discord user objects.
+        """
+        users_by_key = {(user.id, user.name): user for user in users}
+        keys = [{"id": user_id, "name": name} for user_id, name in users_by_key]
+        
+        try:
+            # find which users already exist, 100 keys per request (the BatchGetItem limit)
+            existing_keys = set()
+            for i in range(0, len(keys), 100):
+                request_items = {
+                    self.table.name: {
+                        "Keys": keys[i:i + 100],
+                        "ProjectionExpression": "#id, #name",
+                        "ExpressionAttributeNames": {"#id": "id", "#name": "name"}
+                    }
+                }
+                retry_delay = BATCH_RETRY_BASE_DELAY
+                while request_items:
+                    response = self.dyn_resource.batch_get_item(RequestItems=request_items)
+                    for item in response["Responses"].get(self.table.name, []):
+                        existing_keys.add((int(item["id"]), item["name"]))
+                    request_items = response.get("UnprocessedKeys")
+                    
+                    # unprocessed keys mean the table is throttling, so wait a jittered, growing delay before resending them
+                    if request_items:
+                        time.sleep(random.uniform(0, retry_delay))
+                        retry_delay = min(retry_delay * 2, BATCH_RETRY_MAX_DELAY)
             
-            except ClientError as err:
-                logger.error(
-                    "Couldn't add user %s to table %s. Here's why: %s: %s",
-                    user,
-                    self.table.name,
-                    err.response["Error"]["Code"],
-                    err.response["Error"]["Message"],
-                )
-                raise
+            # the batch writer sends puts 25 at a time and resends unprocessed items
+            with self.table.batch_writer() as batch:
+                for key, user in users_by_key.items():
+                    if key not in existing_keys:
+                        batch.put_item(Item=self.new_user_item(user))
+        
+        except ClientError as err:
+            logger.error(
+                "Couldn't add users to table %s. Here's why: %s: %s",
+                self.table.name,
+                err.response["Error"]["Code"],
+                err.response["Error"]["Message"],
+            )
+            raise
             
     def get_flashcard_by_id(self, user, id):
         """
@@ -205,23 +381,96 @@ class Users:
         :return: The flashcard with the provided ID, or None if not found.
         """
         
-        # get the user's flashcard set
-        user_flashcard_set = self.get_flashcard_set(user)
+        # use the user's cached flashcard set if there is one
+        user_flashcard_set = self.get_cached_flashcard_set(user.id)
+        if user_flashcard_set is not None:
+            return user_flashcard_set.get(id)
+        
+        # otherwise read only the requested flashcard
+        item = self.table.get_item(
+            Key={"id": user.id, "name": user.name},
+            ProjectionExpression="flashcard_set.#id",
+            ExpressionAttributeNames={"#id": id}
+        ).get("Item", {})
         
         # return the flashcard with the provided id
-        return user_flashcard_set.get(id)
+        return item.get("flashcard_set", {}).get(id)
+    
+    def get_cached_flashcard_set(self, user_id):
+        """
+        Retrieves a user's flashcard set from memory.
+
+        :param user_id: The ID of the user whose flashcard set is being retrieved.
+        :return: The cached flashcard set, or None if it isn't cached or has expired.
+        """
+        
+        with self._flashcard_set_cache_lock:
+            cached = self.flashcard_set_cache.get(user_id)
+            if cached is None:
+                return None
+            if cached[0] <= time.monotonic():
+                del self.flashcard_set_cache[user_id]
+                return None
+            
+            self.flashcard_set_cache.move_to_end(user_id)
+            return cached[1]
+    
+    def cache_flashcard_set(self, user_id, user_flashcard_set):
+        """
+        Stores a user's flashcard set in memory, dropping the least recently used set if the cache is full.
+
+        :param user_id: The ID of the user whose flashcard set is being stored.
+        :param user_flashcard_set: The user's current flashcard set.
+        """
+        
+        with self._flashcard_set_cache_lock:
+            self.flashcard_set_cache[user_id] = (time.monotonic() + FLASHCARD_SET_CACHE_TTL, user_flashcard_set)
+            self.flashcard_set_cache.move_to_end(user_id)
+            if len(self.flashcard_set_cache) > FLASHCARD_SET_CACHE_SIZE:
+                self.flashcard_set_cache.popitem(last=False)
+    
+    def drop_cached_flashcard_set(self, user_id):
+        """
+        Removes a user's flashcard set from memory, so the next read gets it from the table.
+
+        :param user_id: The ID of the user whose flashcard set has been written.
+        """
+        
+        with self._flashcard_set_cache_lock:
+            self.flashcard_set_cache.pop(user_id, None)
+    
+    def flashcard_set_lock(self, user_id):
+        """
+        Gets the lock that serializes reads and writes of a user's flashcard set, so a read
+        started before a write can't cache the set after the write has dropped it.
+
+        :param user_id: The ID of the user whose flashcard set is being accessed.
+        :return: The user's flashcard set lock.
+        """
+        
+        return self._flashcard_set_locks[user_id % FLASHCARD_SET_LOCK_COUNT]
     
     def get_flashcard_set(self, user):
         """
         Retrieves the flashcard set belonging to the specified user.
+        
+        The set is read from the table once and then served from memory until it expires or is
+        written. The returned dictionary is shared, so it must not be modified.
 
         :param user: The user whose flashcard set is being retrieved.
         :return: The flashcard set of the user.
         """
         
-        return self.table.get_item(
-            Key={"id": user.id, "name": user.name}
-        )["Item"]["flashcard_set"]
+        with self.flashcard_set_lock(user.id):
+            user_flashcard_set = self.get_cached_flashcard_set(user.id)
+            if user_flashcard_set is None:
+                user_flashcard_set = self.table.get_item(
+                    Key={"id": user.id, "name": user.name},
+                    ProjectionExpression="flashcard_set"
+                )["Item"]["flashcard_set"]
+                self.cache_flashcard_set(user.id, user_flashcard_set)
+        
+        return user_flashcard_set
     
     def get_random_flashcards(self, user, num_flashcards, filters=[]):
         """
@@ -233,12 +482,15 @@ class Users:
         :return: A list of randomly selected flashcards.
         """
         
-        # get the user's flashcard set and convert to a list
-        user_flashcard_list = list(self.get_flashcard_set(user).values())
-        
-        # apply filters if any
-        for filter_obj in filters:
-            user_flashcard_list = filter_obj.apply(user_flashcard_list)
+        # get the user's flashcard set as a list, keeping only flashcards that pass every filter
+        user_flashcard_set = self.get_flashcard_set(user)
+        if filters:
+            user_flashcard_list = [
+                flashcard for flashcard in user_flashcard_set.values()
+                if all(filter_obj.matches(flashcard) for filter_obj in filters)
+            ]
+        else:
+            user_flashcard_list = list(user_flashcard_set.values())
             
         # ensure that you cannot request more flashcards than available
         num_flashcards = min(num_flashcards, len(user_flashcard_list))
@@ -253,37 +505,34 @@ class Users:
         Adds a word object to the flashcard set for a user in the table.
 
         :param user: Discord user object.
-        :param search_obj: The search object to add to the user's flashcard set dictionary.
+        :param flashcard_dict: The flashcard to add to the user's flashcard set dictionary.
+        :return: True if the flashcard was added, False if the flashcard set is at maximum capacity.
         """
         
-        try:
-            # retrieve the user's flashcard_set
-            user_flashcard_set = self.get_flashcard_set(user)
-            
-            if len(user_flashcard_set) >= self.max_capacity:
-                return False
-
-            # update the flashcard_set dictionary with the new key-value pair
-            user_flashcard_set[flashcard_dict["id"]] = flashcard_dict
-
-            # update the item with the modified flashcard_set
-            self.table.update_item(
-                Key={"id": user.id, "name": user.name},
-                UpdateExpression="SET flashcard_set = :val",
-                ExpressionAttributeValues={':val': user_flashcard_set},
-                ReturnValues="UPDATED_NEW"
-            )
-        except ClientError as err:
-            logger.error(
-                "Couldn't update user %s in table %s. Here's why: %s: %s",
-                user.name,
-                self.table.name,
-                err.response["Error"]["Code"],
-                err.response["Error"]["Message"],
-            )
-            raise
-        else:
-            return True
+        with self.flashcard_set_lock(user.id):
+            try:
+                # write only the new flashcard, letting the table check the set's capacity
+                self.table.update_item(
+                    Key={"id": user.id, "name": user.name},
+                    UpdateExpression="SET flashcard_set.#id = :val",
+                    ConditionExpression="size(flashcard_set) < :cap",
+                    ExpressionAttributeNames={"#id": flashcard_dict["id"]},
+                    ExpressionAttributeValues={":val": flashcard_dict, ":cap": self.max_capacity}
+                )
+            except ClientError as err:
+                if err.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    return False
+                logger.error(
+                    "Couldn't update user %s in table %s. Here's why: %s: %s",
+                    user.name,
+                    self.table.name,
+                    err.response["Error"]["Code"],
+                    err.response["Error"]["Message"],
+                )
+                raise
+            else:
+                self.drop_cached_flashcard_set(user.id)
+                return True
         
     def update_flashcard(self, user, flashcard_dict):
         """
@@ -293,19 +542,111 @@ class Users:
         :param flashcard_dict (dict): A dictionary representing the flashcard to be updated.
         """
         
-        # retrieve the user's flashcard_set
-        user_flashcard_set = self.get_flashcard_set(user)
-                
-        # update the flashcard_set dictionary with the new key-value pair
-        user_flashcard_set[flashcard_dict["id"]] = flashcard_dict
+        self.update_flashcards(user, [flashcard_dict])
 
-        # update the item with the modified flashcard_set
-        self.table.update_item(
-            Key={"id": user.id, "name": user.name},
-            UpdateExpression="SET flashcard_set = :val",
-            ExpressionAttributeValues={':val': user_flashcard_set},
-            ReturnValues="UPDATED_NEW"
-        )
+    def update_flashcards(self, user, flashcard_dicts):
+        """
+        Updates several flashcards in the user's flashcard set with a single write.
+        
+        :param user: Discord user object.
+        :param flashcard_dicts (list): Dictionaries representing the flashcards to be updated.
+        """
+        
+        if not flashcard_dicts:
+            return
+        
+        # set each flashcard by its nested path, so only the changed flashcards are sent
+        update_clauses = []
+        attribute_names = {}
+        attribute_values = {}
+        for i, flashcard_dict in enumerate(flashcard_dicts):
+            update_clauses.append(f"flashcard_set.#id{i} = :val{i}")
+            attribute_names[f"#id{i}"] = flashcard_dict["id"]
+            attribute_values[f":val{i}"] = flashcard_dict
+        
+        with self.flashcard_set_lock(user.id):
+            self.table.update_item(
+                Key={"id": user.id, "name": user.name},
+                UpdateExpression="SET " + ", ".join(update_clauses),
+                ExpressionAttributeNames=attribute_names,
+                ExpressionAttributeValues=attribute_values
+            )
+            self.drop_cached_flashcard_set(user.id)
+        
+        for flashcard_dict in flashcard_dicts:
+            self.schedule_review(user.id, flashcard_dict)
+
+    def update_flashcard_reviews(self, user, flashcard_dicts):
+        """
+        Saves the spaced repetition data of several reviewed flashcards, skipping any flashcard
+        that has been deleted since it was read.
+        
+        Only each flashcard's spaced_repetition path is written, so labels or other changes made
+        to the flashcards in the meantime are kept.
+        
+        :param user: Discord user object.
+        :param flashcard_dicts (list): Dictionaries representing the reviewed flashcards.
+        """
+        
+        if not flashcard_dicts:
+            return
+        
+        with self.flashcard_set_lock(user.id):
+            try:
+                self._update_spaced_repetition(user, flashcard_dicts)
+                saved_flashcards = flashcard_dicts
+            except ClientError as err:
+                if err.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                # at least one flashcard was deleted, so save the rest one at a time
+                saved_flashcards = []
+                for flashcard_dict in flashcard_dicts:
+                    try:
+                        self._update_spaced_repetition(user, [flashcard_dict])
+                    except ClientError as card_err:
+                        if card_err.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                            raise
+                    else:
+                        saved_flashcards.append(flashcard_dict)
+            finally:
+                self.drop_cached_flashcard_set(user.id)
+        
+        for flashcard_dict in saved_flashcards:
+            self.schedule_review(user.id, flashcard_dict)
+    
+    def _update_spaced_repetition(self, user, flashcard_dicts):
+        """
+        Sets the spaced repetition data of each flashcard by its nested path, on the condition that every flashcard still exists.
+        """
+        
+        update_clauses = []
+        conditions = []
+        attribute_names = {}
+        attribute_values = {}
+        for i, flashcard_dict in enumerate(flashcard_dicts):
+            update_clauses.append(f"flashcard_set.#id{i}.spaced_repetition = :val{i}")
+            conditions.append(f"attribute_exists(flashcard_set.#id{i})")
+            attribute_names[f"#id{i}"] = flashcard_dict["id"]
+            attribute_values[f":val{i}"] = flashcard_dict["spaced_repetition"]
+        
+        try:
+            self.table.update_item(
+                Key={"id": user.id, "name": user.name},
+                UpdateExpression="SET " + ", ".join(update_clauses),
+                ConditionExpression=" AND ".join(conditions),
+                ExpressionAttributeNames=attribute_names,
+                ExpressionAttributeValues=attribute_values
+            )
+        except ClientError as err:
+            if err.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                logger.error(
+                    "Couldn't update user %s in table %s. Here's why: %s: %s",
+                    user.name,
+                    self.table.name,
+                    err.response["Error"]["Code"],
+                    err.response["Error"]["Message"],
+                )
+            raise
 
     def label_flashcards(self, user, label, flashcards_to_label):
         """
@@ -319,21 +660,28 @@ class Users:
         # account for index 1 list of flashcards by subtracting one from every flashcard index
         flashcards_to_label = [index - 1 for index in flashcards_to_label]
         
-        # get user's flashcard set
-        user_flashcard_set = self.get_flashcard_set(user)
-    
-        for i in flashcards_to_label:
-            # get the flashcard ID using index, then update its label
-            flashcard_id = list(user_flashcard_set.keys())[i] 
-            user_flashcard_set[flashcard_id]["label"] = label
-        
-        # update the user's flashcard list
-        self.table.update_item(
-            Key={"id": user.id, "name": user.name},
-            UpdateExpression="SET flashcard_set = :val",
-            ExpressionAttributeValues={':val': user_flashcard_set},
-            ReturnValues="UPDATED_NEW"
-        )
+        with self.flashcard_set_lock(user.id):
+            # get the IDs of the user's flashcards in display order
+            flashcard_ids = list(self.get_flashcard_set(user).keys())
+            
+            # set only the label of each flashcard by its nested path
+            update_clauses = []
+            attribute_names = {}
+            for i in set(flashcards_to_label):
+                update_clauses.append(f"flashcard_set.#id{i}.label = :label")
+                attribute_names[f"#id{i}"] = flashcard_ids[i]
+            
+            if not update_clauses:
+                return
+            
+            # update the user's flashcard list
+            self.table.update_item(
+                Key={"id": user.id, "name": user.name},
+                UpdateExpression="SET " + ", ".join(update_clauses),
+                ExpressionAttributeNames=attribute_names,
+                ExpressionAttributeValues={":label": label}
+            )
+            self.drop_cached_flashcard_set(user.id)
     
     def delete_flashcards(self, user, flashcards_to_delete):
         """
@@ -346,34 +694,61 @@ class Users:
         # account for index 1 list of flashcards by subtracting one from every flashcard index
         flashcards_to_delete = [index - 1 for index in flashcards_to_delete]
         
-        # get user's flashcard set
-        user_flashcard_set = self.get_flashcard_set(user)
-        
-        # create a new list to store flashcards without the ones to be deleted
-        new_flashcard_set = {}
-        
-        for i, (flashcard_id, flashcard_data) in enumerate(user_flashcard_set.items()):
-            if i not in flashcards_to_delete:
-                new_flashcard_set[flashcard_id] = flashcard_data
-        
-        # update the user's flashcard list
-        self.table.update_item(
-            Key={"id": user.id, "name": user.name},
-            UpdateExpression="SET flashcard_set = :val",
-            ExpressionAttributeValues={':val': new_flashcard_set},
-            ReturnValues="UPDATED_NEW"
-        )
+        with self.flashcard_set_lock(user.id):
+            # get the IDs of the flashcards to delete from the user's flashcard set, in display order
+            flashcard_ids = list(self.get_flashcard_set(user).keys())
+            
+            # remove only the chosen flashcards by their nested paths, so flashcards written since the set was read are kept
+            remove_paths = []
+            attribute_names = {}
+            for i in set(flashcards_to_delete):
+                remove_paths.append(f"flashcard_set.#id{i}")
+                attribute_names[f"#id{i}"] = flashcard_ids[i]
+            
+            if not remove_paths:
+                return
+            
+            # update the user's flashcard list
+            self.table.update_item(
+                Key={"id": user.id, "name": user.name},
+                UpdateExpression="REMOVE " + ", ".join(remove_paths),
+                ExpressionAttributeNames=attribute_names
+            )
+            self.drop_cached_flashcard_set(user.id)
 
-    def update_user_number_progress(self, user, field, value):
+    def update_user_number_progress(self, user, field, value, return_progress=False):
         """
         Updates a specified Number field of a user's progress data with a specified value.
+
+        :param return_progress: Optional. Whether to return the user's whole progress map after the update.
+        :return: The updated progress map if return_progress is set, otherwise None.
         """
+        return self.update_user_progress(user, {field: value}, return_progress=return_progress)
+
+    def update_user_progress(self, user, deltas, return_progress=False):
+        """
+        Adds a value to each of several Number fields of a user's progress data with a single write.
+
+        :param deltas: A dictionary of progress field names and the values to add to them.
+        :param return_progress: Optional. Whether to return the user's whole progress map after the update.
+        :return: The updated progress map if return_progress is set, otherwise None.
+        """
+        update_clauses = []
+        attribute_names = {}
+        attribute_values = {}
+        for i, (field, value) in enumerate(deltas.items()):
+            update_clauses.append(f"progress.#field{i} = progress.#field{i} + :val{i}")
+            attribute_names[f"#field{i}"] = field
+            attribute_values[f":val{i}"] = value
+        
         try:
-            self.table.update_item(
+            # only the changed fields come back unless the caller needs the rest of the progress
+            response = self.table.update_item(
                 Key={"id": user.id, "name": user.name},
-                UpdateExpression=f"set progress.{field} = progress.{field} + :val",
-                ExpressionAttributeValues={":val": value},
-                ReturnValues="UPDATED_NEW",
+                UpdateExpression="set " + ", ".join(update_clauses),
+                ExpressionAttributeNames=attribute_names,
+                ExpressionAttributeValues=attribute_values,
+                ReturnValues="ALL_NEW" if return_progress else "UPDATED_NEW",
             )
         except ClientError as err:
             logger.error(
@@ -384,6 +759,9 @@ class Users:
                 err.response["Error"]["Message"],
             )
             raise
+        
+        if return_progress:
+            return response["Attributes"]["progress"]
 
     def add_badge_to_badges(self, user, badge):
         
@@ -404,4 +782,61 @@ class Users:
                 err.response["Error"]["Code"],
                 err.response["Error"]["Message"],
             )
-            raise
\ No newline at end of file
+            raise
+
+    def build_review_queue(self):
+        """
+        Rebuilds the queue of upcoming flashcard reminders from every flashcard in the table.
+        """
+        
+        review_queue = []
+        # only the heap entries are kept, so reading page by page bounds memory to one page of users
+        for user_page in self.iter_user_pages():
+            for user_entry in user_page:
+                # users with notifications off are never reminded, so their cards aren't indexed
+                if not user_entry["preferences"]["notifications"] or not user_entry["flashcard_set"]:
+                    continue
+                for flashcard_id, flashcard_dict in user_entry["flashcard_set"].items():
+                    next_reminder = FlashcardObject.next_reminder_time(flashcard_dict["spaced_repetition"])
+                    if next_reminder is not None:
+                        review_queue.append((next_reminder, int(user_entry["id"]), flashcard_id))
+        
+        heapq.heapify(review_queue)
+        with self._review_queue_lock:
+            self.review_queue = review_queue
+
+    def schedule_review(self, user_id, flashcard_dict, reminder_time=None):
+        """
+        Queues the next reminder for a flashcard.
+        
+        Entries are never removed when a card changes; pop_due_flashcards callers are expected
+        to check a popped card against its stored data, which skips outdated entries.
+
+        :param user_id: The ID of the user who owns the flashcard.
+        :param flashcard_dict: The flashcard to schedule a reminder for.
+        :param reminder_time: Optional. The time in Unix seconds to queue the reminder for, instead of
+            the flashcard's next reminder time.
+        """
+        
+        next_reminder = reminder_time
+        if next_reminder is None:
+            next_reminder = FlashcardObject.next_reminder_time(flashcard_dict["spaced_repetition"])
+        if next_reminder is not None:
+            with self._review_queue_lock:
+                heapq.heappush(self.review_queue, (next_reminder, int(user_id), flashcard_dict["id"]))
+
+    def pop_due_flashcards(self, current_time):
+        """
+        Removes and returns the queued flashcards whose reminders are due.
+
+        :param current_time: The current time in Unix seconds.
+        :return: A dictionary mapping user IDs to sets of due flashcard IDs.
+        """
+        
+        due_flashcards = {}
+        with self._review_queue_lock:
+            while self.review_queue and self.review_queue[0][0] <= current_time:
+                _, user_id, flashcard_id = heapq.heappop(self.review_queue)
+                due_flashcards.setdefault(user_id, set()).add(flashcard_id)
+        
+        return due_flashcards
@@ -7,8 +7,11 @@ Provide a word as input to the 'get_word_info' function to receive a list of dic
 """
 
 import os
-import requests
-import xmltodict
+import time
+import asyncio
+import aiohttp
+from collections import OrderedDict
+from xml.etree import ElementTree
 from dotenv import load_dotenv
 from class_interaction_objects import SearchObject
 
@@ -17,55 +20,92 @@ load_dotenv()
 URL = "https://krdict.korean.go.kr/api/search"
 MAX_SEARCH_RESULTS = 5
 
-def get_search_results(word):
+# query parameters shared by every search, built once after the API key is loaded
+BASE_PARAMS = {
+    "key": os.getenv("KOREAN_DICT_API_KEY", ""),
+    "type_search": "search",
+    "part": "word",
+    "sort": "dict",
+    "translated": "y",
+    "trans_lang": "1"
+}
+
+# recent search results, least recently used first, as word: (expiry time, results)
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 3600
+search_cache = OrderedDict()
+
+async def get_search_results(word, session):
+    """
+    Get the search results for a word, reusing a recent lookup of the same word when there is one.
+
+    :param word: The Korean word to search for.
+    :param session: The aiohttp ClientSession to send the request with.
+    :return: A list of SearchObjects, None if there are no results, or an error string if the request failed.
+    """
+    
+    word = word.strip()
+    now = time.monotonic()
+    
+    cached = search_cache.get(word)
+    if cached is not None and cached[0] > now:
+        search_cache.move_to_end(word)
+        return cached[1]
+    
+    search_results = await fetch_search_results(word, session)
+    
+    # failed requests aren't cached so the next search retries them
+    if not isinstance(search_results, str):
+        search_cache[word] = (now + SEARCH_CACHE_TTL, search_results)
+        search_cache.move_to_end(word)
+        if len(search_cache) > SEARCH_CACHE_SIZE:
+            search_cache.popitem(last=False)
+    
+    return search_results
+
+async def fetch_search_results(word, session):
     search_results = []
-    params = {
-        "key": os.getenv("KOREAN_DICT_API_KEY"),
-        "type_search": "search",
-        "q": word,
-        "part": "word",
-        "sort": "dict",
-        "translated": "y",
-        "trans_lang": "1"
-    }
+    params = {**BASE_PARAMS, "q": word}
     
     try:
-        response = requests.get(URL, params)
-        response.raise_for_status()
-    except requests.exceptions.HTTPError as errh:
+        async with session.get(URL, params=params) as response:
+            response.raise_for_status()
+            content = await response.read()
+    except aiohttp.ClientResponseError as errh:
         return f"HTTP Error: {errh}"
-    except requests.exceptions.ConnectionError as errc:
+    except aiohttp.ClientConnectionError as errc:
         return f"Error Connecting: {errc}"
-    except requests.exceptions.Timeout as errt:
+    except asyncio.TimeoutError as errt:
         return f"Timeout Error: {errt}"
-    except requests.exceptions.RequestException as err:
+    except aiohttp.ClientError as err:
         return f"Oops: Something Else {err}"
     
     else:
-        dict_data = xmltodict.parse(response.content)["channel"]
+        # read only the first item's senses straight from the element tree instead of converting the whole document
+        channel = ElementTree.fromstring(content)
         
-        if dict_data["total"] == "0":
+        if channel.findtext("total") == "0":
             return None
         
-        search_items = dict_data["item"]
-        if not isinstance(search_items, list):
-            search_items = [search_items]
-
-        sense_data = search_items[0]["sense"]
-        if not isinstance(sense_data, list):
-            sense_data = [sense_data]
+        search_item = channel.find("item")
+        if search_item is None:
+            return None
+        
+        target_code = search_item.findtext("target_code")
+        headword = search_item.findtext("word")
         
         # construct the output as a list of search objects
-        for i, sense in enumerate(sense_data):
+        for i, sense in enumerate(search_item.iterfind("sense")):
             if i >= MAX_SEARCH_RESULTS:
                 break
             
+            translation = sense.find("translation")
             search_obj = SearchObject(
-                search_items[0]["target_code"] + str(i),
-                search_items[0]["word"],
-                sense["definition"],
-                sense["translation"]["trans_word"],
-                sense["translation"]["trans_dfn"]
+                f"{target_code}{i}",
+                headword,
+                sense.findtext("definition"),
+                translation.findtext("trans_word"),
+                translation.findtext("trans_dfn")
             )
             search_results.append(search_obj)
             
@@ -9,10 +9,26 @@ and creates one if it doesn't exist. Finally, it initializes and runs the Discor
 import os
 import logging
 import boto3
+from botocore.config import Config
 from dotenv import load_dotenv
 from class_users import Users
 from class_bot import Bot
 
+# jittered, rate-aware retries under throttling, and enough pooled connections for the bot's worker threads
+DYNAMODB_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10}, max_pool_connections=50)
+
+def new_dynamodb_resource():
+    """
+    Creates a DynamoDB resource from its own session, since neither is safe to share across threads.
+    """
+    
+    return boto3.session.Session().resource(
+        "dynamodb", 
+        region_name=os.getenv('AWS_DEFAULT_REGION'), 
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY'), 
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        config=DYNAMODB_CONFIG
+    )
 
 if __name__ == '__main__':
     
@@ -21,21 +37,16 @@ if __name__ == '__main__':
     load_dotenv()
     
     # init table of users for discord bot
-    users = Users(boto3.resource(
-        "dynamodb", 
-        region_name=os.getenv('AWS_DEFAULT_REGION'), 
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY'), 
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
-        ))
+    users = Users(new_dynamodb_resource)
 
     # create a table if it doesn't already exist
     table_name = "discord-bot-1"
     users_exists = users.exists(table_name)
     if not users_exists:
-        print(f"\nCreating table {table_name}...")
+        logging.info("Creating table %s...", table_name)
         users.create_table(table_name)
-        print(f"\nCreated table {users.table.name}.")
-    print(f"Now using Dynamo table: {users.table.name}")
+        logging.info("Created table %s.", users.table.name)
+    logging.info("Now using Dynamo table: %s", users.table.name)
     
     # init discord bot and run it
     bot = Bot(users)